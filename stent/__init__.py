@@ -1,7 +1,8 @@
 from stent.executor import Stent, DurableFunction, ExpiryError, sleep, WorkerLifecycle, install_structured_logging
-from stent.core import Result, RetryPolicy, ExecutionState
+from stent.core import Result, RetryPolicy, ExecutionState, ExecutionSummary
 from stent.registry import registry
 from stent.metrics import MetricsRecorder
+from stent.utils.parallel import parallel_map
 
 __all__ = [
     "Stent",
@@ -10,9 +11,11 @@ __all__ = [
     "Result",
     "RetryPolicy",
     "ExecutionState",
+    "ExecutionSummary",
     "registry",
     "sleep",
     "WorkerLifecycle",
     "install_structured_logging",
     "MetricsRecorder",
+    "parallel_map",
 ]
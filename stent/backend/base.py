@@ -1,6 +1,6 @@
 from typing import Protocol, List, Optional
 from datetime import datetime, timedelta
-from stent.core import ExecutionRecord, TaskRecord, ExecutionProgress, SignalRecord, DeadLetterRecord
+from stent.core import ExecutionRecord, ExecutionSummary, TaskRecord, ExecutionProgress, SignalRecord, DeadLetterRecord
 
 class Backend(Protocol):
     async def init_db(self) -> None: ...
@@ -11,6 +11,7 @@ class Backend(Protocol):
     async def get_execution(self, execution_id: str) -> ExecutionRecord | None: ...
     async def update_execution(self, record: ExecutionRecord) -> None: ...
     async def list_executions(self, limit: int = 10, offset: int = 0, state: str | None = None) -> List[ExecutionRecord]: ...
+    async def list_execution_summaries(self, limit: int = 10, offset: int = 0, state: str | None = None) -> List[ExecutionSummary]: ...
     async def count_executions(self, state: str | None = None) -> int: ...
 
     # tasks
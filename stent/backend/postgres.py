@@ -1,18 +1,21 @@
 import asyncpg
 import asyncpg.pool
-import json
 import logging
 from datetime import datetime, timedelta
 from typing import List, Optional, Any, Union
 from stent.backend.base import Backend
-from stent.core import ExecutionRecord, TaskRecord, ExecutionProgress, RetryPolicy, SignalRecord, DeadLetterRecord
+from stent.core import ExecutionRecord, ExecutionSummary, TaskRecord, ExecutionProgress, RetryPolicy, SignalRecord, DeadLetterRecord
 from stent.backend.utils import (
+    EXECUTION_SUMMARY_COLUMNS,
     build_filtered_count_query,
     build_filtered_list_query,
+    dumps_json,
     dollar_placeholder,
     execution_row_values,
+    loads_json,
     row_to_dead_letter,
     row_to_execution,
+    row_to_execution_summary,
     row_to_progress,
     row_to_signal,
     row_to_task,
@@ -251,7 +254,7 @@ class PostgresBackend(Backend):
             """, 
                 record.state, record.args, record.kwargs, record.result, record.error,
                 record.retries, record.started_at, record.completed_at, record.expiry_at,
-                json.dumps(record.tags), record.priority, record.queue, record.id
+                dumps_json(record.tags), record.priority, record.queue, record.id
             )
 
     async def list_executions(self, limit: int = 10, offset: int = 0, state: str | None = None) -> List[ExecutionRecord]:
@@ -272,6 +275,22 @@ class PostgresBackend(Backend):
                 results.append(self._row_to_execution(row, progress=[]))
             return results
 
+    async def list_execution_summaries(self, limit: int = 10, offset: int = 0, state: str | None = None) -> List[ExecutionSummary]:
+        assert self.pool is not None
+        async with self.pool.acquire() as conn:
+            query, params = build_filtered_list_query(
+                table="executions",
+                filters=[("state", state)],
+                order_by="created_at DESC",
+                limit=limit,
+                offset=offset,
+                placeholder=dollar_placeholder,
+                columns=EXECUTION_SUMMARY_COLUMNS,
+            )
+
+            rows = await conn.fetch(query, *params)
+            return [row_to_execution_summary(row) for row in rows]
+
     async def count_executions(self, state: str | None = None) -> int:
         assert self.pool is not None
         async with self.pool.acquire() as conn:
@@ -379,23 +398,34 @@ class PostgresBackend(Backend):
         else:
             queue_clause = "AND 1=1"
 
+        claimable = f"""
+            WHERE (
+                state='pending'
+                OR (state='running' AND lease_expires_at < $1)
+            )
+            AND (scheduled_for IS NULL OR scheduled_for <= $2)
+            AND kind != 'signal'
+            {queue_clause}
+            ORDER BY priority DESC, created_at ASC
+        """
+
         assert self.pool is not None
         async with self.pool.acquire() as conn:
+            if not should_filter_by_tags and not concurrency_limits:
+                # Nothing to filter in Python: lock and claim the head of the queue in one statement
+                n = len(params)
+                fast_query = f"""
+                    UPDATE tasks
+                    SET state='running', worker_id=${n + 1}, lease_expires_at=${n + 2}, started_at=${n + 3}
+                    WHERE id = (SELECT id FROM tasks {claimable} LIMIT 1 FOR UPDATE SKIP LOCKED)
+                    RETURNING *
+                """
+                claimed_row = await conn.fetchrow(fast_query, *params, worker_id, expires_at, now)
+                return self._row_to_task(claimed_row) if claimed_row else None
+
             async with conn.transaction():
                 # 1. Fetch candidates
-                query = f"""
-                    SELECT * FROM tasks
-                    WHERE (
-                        state='pending'
-                        OR (state='running' AND lease_expires_at < $1)
-                    )
-                    AND (scheduled_for IS NULL OR scheduled_for <= $2)
-                    AND kind != 'signal'
-                    {queue_clause}
-                    ORDER BY priority DESC, created_at ASC
-                    LIMIT 50
-                    FOR UPDATE SKIP LOCKED
-                """
+                query = f"SELECT * FROM tasks {claimable} LIMIT 50 FOR UPDATE SKIP LOCKED"
                 rows = await conn.fetch(query, *params)
                 
                 if not rows:
@@ -403,7 +433,7 @@ class PostgresBackend(Backend):
                 
                 for row in rows:
                     if should_filter_by_tags:
-                        task_tags = json.loads(row["tags"]) if row["tags"] else []
+                        task_tags = loads_json(row["tags"]) if row["tags"] else []
                         if task_tags and worker_tags_set.isdisjoint(task_tags):
                             continue
 
@@ -1,19 +1,23 @@
 import aiosqlite
 import asyncio
+import functools
 import sqlite3
-import json
 import logging
 from datetime import datetime, timedelta
 from typing import List, Optional, Any
 from stent.backend.base import Backend
-from stent.core import ExecutionRecord, TaskRecord, ExecutionProgress, RetryPolicy, SignalRecord, DeadLetterRecord
+from stent.core import ExecutionRecord, ExecutionSummary, TaskRecord, ExecutionProgress, RetryPolicy, SignalRecord, DeadLetterRecord
 from stent.backend.utils import (
+    EXECUTION_SUMMARY_COLUMNS,
     build_filtered_count_query,
     build_filtered_list_query,
+    dumps_json,
     execution_row_values,
+    loads_json,
     qmark_placeholder,
     row_to_dead_letter,
     row_to_execution,
+    row_to_execution_summary,
     row_to_progress,
     row_to_signal,
     row_to_task,
@@ -25,12 +29,94 @@ from stent.backend.utils import (
 
 logger = logging.getLogger(__name__)
 
+# Shared SQL text: sqlite3 caches prepared statements keyed by the exact string,
+# so hot-path queries are built once instead of re-formatted per call.
+_SQL_COUNT_RUNNING_STEP = """
+    SELECT COUNT(*) FROM tasks
+    WHERE step_name = ?
+    AND state = 'running'
+    AND lease_expires_at > ?
+"""
+
+_SQL_INSERT_PROGRESS = (
+    "INSERT INTO execution_progress (execution_id, step, status, started_at, completed_at, detail) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+
+# Upper bound on progress rows group-committed in a single transaction.
+_PROGRESS_BATCH_SIZE = 64
+
+_SQL_CLAIM_BY_ID = """
+    UPDATE tasks
+    SET state='running', worker_id=?, lease_expires_at=?, started_at=?
+    WHERE id = ?
+    AND (
+        state='pending'
+        OR (state='running' AND lease_expires_at < ?)
+    )
+    RETURNING *
+"""
+
+
+@functools.lru_cache(maxsize=32)
+def _claim_queries(queue_count: int) -> tuple[str, str]:
+    """Return (single-statement claim, candidate scan) SQL for a given number of queue filters."""
+    if queue_count:
+        placeholders = ",".join(["?"] * queue_count)
+        queue_clause = f"AND (queue IN ({placeholders}) OR queue IS NULL)"
+    else:
+        queue_clause = "AND 1=1"
+
+    claimable = f"""
+        WHERE (
+            state='pending'
+            OR (state='running' AND lease_expires_at < ?)
+        )
+        AND (scheduled_for IS NULL OR scheduled_for <= ?)
+        AND kind != 'signal'
+        {queue_clause}
+        ORDER BY priority DESC, created_at ASC
+    """
+    fast_query = f"""
+        UPDATE tasks
+        SET state='running', worker_id=?, lease_expires_at=?, started_at=?
+        WHERE id = (SELECT id FROM tasks {claimable} LIMIT 1)
+        RETURNING *
+    """
+    return fast_query, f"SELECT * FROM tasks {claimable} LIMIT 50"
+
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
 def _adapt_datetime(dt: datetime) -> str:
     return dt.isoformat()
 
+def _datetime_to_wall_micros(dt: datetime | None) -> int | str | None:
+    # Naive datetimes are stored as integer microseconds since naive 1970-01-01 00:00, i.e. local
+    # wall-clock time rather than UTC epoch micros. Aware ones keep their offset as ISO text.
+    if dt is None:
+        return None
+    if dt.tzinfo is not None:
+        return dt.isoformat()
+    return (dt - _EPOCH) // _MICROSECOND
+
 def _convert_datetime(val: bytes) -> datetime:
+    digits = val[1:] if val.startswith(b"-") else val
+    if digits.isdigit():
+        return _EPOCH + timedelta(microseconds=int(val))
     return datetime.fromisoformat(val.decode("utf-8"))
 
+def _progress_row(execution_id: str, progress: ExecutionProgress) -> tuple[Any, ...]:
+    return (
+        execution_id,
+        progress.step,
+        progress.status,
+        _datetime_to_wall_micros(progress.started_at),
+        _datetime_to_wall_micros(progress.completed_at),
+        progress.detail,
+    )
+
 sqlite3.register_adapter(datetime, _adapt_datetime)
 sqlite3.register_converter("datetime", _convert_datetime)
 sqlite3.register_converter("TIMESTAMP", _convert_datetime)
@@ -58,6 +144,8 @@ class SQLiteBackend(Backend):
         self._connection: Optional[aiosqlite.Connection] = None
         self._lock = asyncio.Lock()
         self._closed = False
+        self._pending_progress: list[tuple[tuple[Any, ...], asyncio.Future[None]]] = []
+        self._progress_flusher: asyncio.Task[None] | None = None
 
     async def _get_connection(self) -> aiosqlite.Connection:
         """Get or create the persistent connection."""
@@ -68,11 +156,15 @@ class SQLiteBackend(Backend):
                 self.db_path,
                 detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
                 isolation_level=None,  # Enable manual transaction control
+                cached_statements=256,
             )
             self._connection.row_factory = aiosqlite.Row
             # Enable WAL mode for better concurrent read performance
             await self._connection.execute("PRAGMA journal_mode=WAL")
             await self._connection.execute("PRAGMA busy_timeout=5000")
+            # WAL keeps NORMAL durable across crashes (only the last commits may roll back)
+            await self._connection.execute("PRAGMA synchronous=NORMAL")
+            await self._connection.execute("PRAGMA temp_store=MEMORY")
         else:
             # Ensure no stale transaction is left open from a cancelled operation
             if self._connection._conn.in_transaction:
@@ -81,6 +173,9 @@ class SQLiteBackend(Backend):
 
     async def close(self) -> None:
         """Close the persistent connection and release resources."""
+        flusher = self._progress_flusher
+        if flusher is not None and not flusher.done() and flusher.get_loop() is asyncio.get_running_loop():
+            await asyncio.wait((flusher,))
         async with self._lock:
             self._closed = True
             if self._connection is not None:
@@ -217,8 +312,8 @@ class SQLiteBackend(Backend):
         )
         for p in record.progress:
             await db.execute(
-                "INSERT INTO execution_progress (execution_id, step, status, started_at, completed_at, detail) VALUES (?, ?, ?, ?, ?, ?)",
-                (record.id, p.step, p.status, p.started_at, p.completed_at, p.detail),
+                _SQL_INSERT_PROGRESS,
+                _progress_row(record.id, p),
             )
 
     def _task_row_values(self, task: TaskRecord) -> tuple[Any, ...]:
@@ -284,7 +379,7 @@ class SQLiteBackend(Backend):
                 """, (
                     record.state, record.args, record.kwargs, record.result, record.error,
                     record.retries, record.started_at, record.completed_at, record.expiry_at,
-                    json.dumps(record.tags), record.priority, record.queue, record.id
+                    dumps_json(record.tags), record.priority, record.queue, record.id
                 ))
                 # Do NOT update progress here as it is managed via execution_progress table
                 await db.execute("COMMIT")
@@ -312,6 +407,23 @@ class SQLiteBackend(Backend):
                     results.append(self._row_to_execution(row, progress=[]))
                 return results
 
+    async def list_execution_summaries(self, limit: int = 10, offset: int = 0, state: str | None = None) -> List[ExecutionSummary]:
+        async with self._lock:
+            db = await self._get_connection()
+            query, params = build_filtered_list_query(
+                table="executions",
+                filters=[("state", state)],
+                order_by="created_at DESC",
+                limit=limit,
+                offset=offset,
+                placeholder=qmark_placeholder,
+                columns=EXECUTION_SUMMARY_COLUMNS,
+            )
+
+            async with db.execute(query, tuple(params)) as cursor:
+                rows = await cursor.fetchall()
+                return [row_to_execution_summary(row) for row in rows]
+
     async def count_executions(self, state: str | None = None) -> int:
         async with self._lock:
             db = await self._get_connection()
@@ -420,33 +532,23 @@ class SQLiteBackend(Backend):
         worker_tags_set = set(tags or [])
         should_filter_by_tags = bool(tags)
         
-        # Helper for queues condition
-        queue_clause = ""
         params: List[Any] = [now, now]
         if queues:
-            placeholders = ",".join(["?"] * len(queues))
-            queue_clause = f"AND (queue IN ({placeholders}) OR queue IS NULL)"
             params.extend(queues)
-        else:
-            queue_clause = "AND 1=1"
+        fast_query, scan_query = _claim_queries(len(queues or ()))
 
         async with self._lock:
             db = await self._get_connection()
             await db.execute("BEGIN IMMEDIATE")
             try:
-                query = f"""
-                    SELECT * FROM tasks
-                    WHERE (
-                        state='pending'
-                        OR (state='running' AND lease_expires_at < ?)
-                    )
-                    AND (scheduled_for IS NULL OR scheduled_for <= ?)
-                    AND kind != 'signal'
-                    {queue_clause}
-                    ORDER BY priority DESC, created_at ASC
-                    LIMIT 50
-                """
-                async with db.execute(query, tuple(params)) as cursor:
+                if not should_filter_by_tags and not concurrency_limits:
+                    # Nothing to filter in Python: claim the head of the queue in one statement
+                    async with db.execute(fast_query, (worker_id, expires_at, now, *params)) as cursor:
+                        claimed_row = await cursor.fetchone()
+                    await db.execute("COMMIT")
+                    return self._row_to_task(claimed_row) if claimed_row else None
+
+                async with db.execute(scan_query, tuple(params)) as cursor:
                     candidates = await cursor.fetchall()
 
                 if not candidates:
@@ -455,7 +557,7 @@ class SQLiteBackend(Backend):
 
                 for row in candidates:
                     if should_filter_by_tags:
-                        task_tags = json.loads(row["tags"]) if row["tags"] else []
+                        task_tags = loads_json(row["tags"]) if row["tags"] else []
                         if task_tags and worker_tags_set.isdisjoint(task_tags):
                             continue
 
@@ -463,32 +565,16 @@ class SQLiteBackend(Backend):
                     limit = concurrency_limits.get(step_name) if concurrency_limits else None
 
                     if limit is not None:
-                        count_query = """
-                            SELECT COUNT(*) FROM tasks 
-                            WHERE step_name = ? 
-                            AND state = 'running' 
-                            AND lease_expires_at > ?
-                        """
-                        async with db.execute(count_query, (step_name, now)) as count_cursor:
+                        async with db.execute(_SQL_COUNT_RUNNING_STEP, (step_name, now)) as count_cursor:
                             count_row = await count_cursor.fetchone()
                             current_count = count_row[0] if count_row else 0
 
                         if current_count >= limit:
                             continue
 
-                    claim_query = """
-                        UPDATE tasks
-                        SET state='running', worker_id=?, lease_expires_at=?, started_at=?
-                        WHERE id = ?
-                        AND (
-                            state='pending'
-                            OR (state='running' AND lease_expires_at < ?)
-                        )
-                        RETURNING *
-                    """
                     claim_params = (worker_id, expires_at, now, row["id"], now)
 
-                    async with db.execute(claim_query, claim_params) as claim_cursor:
+                    async with db.execute(_SQL_CLAIM_BY_ID, claim_params) as claim_cursor:
                         claimed_row = await claim_cursor.fetchone()
                         if claimed_row:
                             await db.execute("COMMIT")
@@ -533,18 +619,46 @@ class SQLiteBackend(Backend):
                 return [self._row_to_task(row) for row in rows]
 
     async def append_progress(self, execution_id: str, progress: ExecutionProgress) -> None:
-        async with self._lock:
-            db = await self._get_connection()
-            await db.execute("BEGIN")
-            try:
-                await db.execute(
-                    "INSERT INTO execution_progress (execution_id, step, status, started_at, completed_at, detail) VALUES (?, ?, ?, ?, ?, ?)",
-                    (execution_id, progress.step, progress.status, progress.started_at, progress.completed_at, progress.detail)
-                )
-                await db.execute("COMMIT")
-            except Exception:
-                await db.execute("ROLLBACK")
-                raise
+        """
+        Queue a progress row and wait until it is committed.
+        Appends that arrive while the connection is busy are group-committed in one transaction.
+        """
+        loop = asyncio.get_running_loop()
+        committed: asyncio.Future[None] = loop.create_future()
+        self._pending_progress.append((_progress_row(execution_id, progress), committed))
+        flusher = self._progress_flusher
+        if flusher is None or flusher.done() or flusher.get_loop() is not loop:
+            self._progress_flusher = loop.create_task(self._flush_progress())
+        await committed
+
+    async def _flush_progress(self) -> None:
+        while self._pending_progress:
+            async with self._lock:
+                batch = self._pending_progress[:_PROGRESS_BATCH_SIZE]
+                del self._pending_progress[:_PROGRESS_BATCH_SIZE]
+                try:
+                    db = await self._get_connection()
+                    await db.execute("BEGIN")
+                    try:
+                        await db.executemany(_SQL_INSERT_PROGRESS, [row for row, _ in batch])
+                        await db.execute("COMMIT")
+                    except Exception:
+                        await db.execute("ROLLBACK")
+                        raise
+                except BaseException as exc:
+                    for _, committed in batch:
+                        if committed.done():
+                            continue
+                        if isinstance(exc, asyncio.CancelledError):
+                            committed.cancel()
+                        else:
+                            committed.set_exception(exc)
+                    if not isinstance(exc, Exception):
+                        raise
+                    continue
+            for _, committed in batch:
+                if not committed.done():
+                    committed.set_result(None)
 
     async def get_cached_result(self, cache_key: str) -> bytes | None:
         async with self._lock:
@@ -2,14 +2,52 @@ from __future__ import annotations
 
 import base64
 import json
+import math
 from datetime import datetime
 from typing import Any, Callable, Sequence
 
-from stent.core import DeadLetterRecord, ExecutionProgress, ExecutionRecord, SignalRecord, TaskRecord, RetryPolicy
+from stent.core import DeadLetterRecord, ExecutionProgress, ExecutionRecord, ExecutionSummary, SignalRecord, TaskRecord, RetryPolicy
+
+try:
+    import orjson as _orjson  # type: ignore[import-not-found]
+except ImportError:
+    _orjson = None
 
 PlaceholderFn = Callable[[int], str]
 
 
+def _has_non_finite(value: Any) -> bool:
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(v) for v in value)
+    return False
+
+
+def dumps_json(value: Any) -> str:
+    """Encode backend column JSON (tags, retry policies, dead-letter payloads), preferring orjson."""
+    # orjson writes inf/nan as null; keep stdlib's Infinity/NaN literals so values round-trip
+    if _orjson is not None and not _has_non_finite(value):
+        try:
+            return _orjson.dumps(value).decode("utf-8")
+        except TypeError:
+            # Values orjson refuses but stdlib encodes, e.g. integers beyond 64 bits
+            pass
+    return json.dumps(value)
+
+
+def loads_json(value: str | bytes) -> Any:
+    if _orjson is not None:
+        try:
+            return _orjson.loads(value)
+        except ValueError:
+            # Stdlib-only literals (Infinity/NaN) from rows written without orjson
+            pass
+    return json.loads(value)
+
+
 def _encode_bytes(value: bytes | None) -> str | None:
     if value is None:
         return None
@@ -100,11 +138,11 @@ def task_record_to_json(task: TaskRecord) -> str:
         "idempotency_key": task.idempotency_key,
         "scheduled_for": _datetime_to_str(task.scheduled_for),
     }
-    return json.dumps(payload)
+    return dumps_json(payload)
 
 
 def task_record_from_json(payload: str) -> TaskRecord:
-    data = json.loads(payload)
+    data = loads_json(payload)
     return TaskRecord(
         id=data["id"],
         execution_id=data["execution_id"],
@@ -134,7 +172,7 @@ def task_record_from_json(payload: str) -> TaskRecord:
 def retry_policy_to_json(policy: RetryPolicy | None) -> str:
     if not policy:
         return "{}"
-    return json.dumps(
+    return dumps_json(
         {
             "max_attempts": policy.max_attempts,
             "backoff_factor": policy.backoff_factor,
@@ -146,7 +184,7 @@ def retry_policy_to_json(policy: RetryPolicy | None) -> str:
 
 
 def retry_policy_from_json(value: str | None) -> RetryPolicy:
-    data = json.loads(value) if value else {}
+    data = loads_json(value) if value else {}
     return RetryPolicy(
         max_attempts=data.get("max_attempts", 3),
         backoff_factor=data.get("backoff_factor", 2.0),
@@ -170,7 +208,7 @@ def execution_row_values(record: ExecutionRecord) -> tuple[Any, ...]:
         record.started_at,
         record.completed_at,
         record.expiry_at,
-        json.dumps(record.tags),
+        dumps_json(record.tags),
         record.priority,
         record.queue,
     )
@@ -194,7 +232,7 @@ def task_row_values(task: TaskRecord) -> tuple[Any, ...]:
         task.completed_at,
         task.worker_id,
         task.lease_expires_at,
-        json.dumps(task.tags),
+        dumps_json(task.tags),
         task.priority,
         task.queue,
         task.idempotency_key,
@@ -213,7 +251,7 @@ def _as_datetime(value: Any) -> datetime | None:
 
 def _loads_tags(value: Any) -> list[str]:
     if isinstance(value, str):
-        return list(json.loads(value))
+        return list(loads_json(value))
     return list(value or [])
 
 
@@ -248,6 +286,19 @@ def row_to_execution(row: Any, progress: list[ExecutionProgress]) -> ExecutionRe
     )
 
 
+EXECUTION_SUMMARY_COLUMNS = "id, state, queue, started_at, completed_at"
+
+
+def row_to_execution_summary(row: Any) -> ExecutionSummary:
+    return ExecutionSummary(
+        id=row["id"],
+        state=row["state"],
+        queue=row["queue"],
+        started_at=_as_datetime(row["started_at"]),
+        completed_at=_as_datetime(row["completed_at"]),
+    )
+
+
 def row_to_task(row: Any) -> TaskRecord:
     return TaskRecord(
         id=row["id"],
@@ -343,9 +394,10 @@ def build_filtered_list_query(
     limit: int,
     offset: int,
     placeholder: PlaceholderFn,
+    columns: str = "*",
 ) -> tuple[str, list[Any]]:
     query, params = build_filtered_query(
-        base_select=f"SELECT * FROM {table}",
+        base_select=f"SELECT {columns} FROM {table}",
         filters=filters,
         placeholder=placeholder,
     )
@@ -30,7 +30,7 @@ from datetime import datetime, timedelta
 from typing import Any, cast
 
 from stent import Stent, ExecutionState
-from stent.core import TaskRecord, DeadLetterRecord
+from stent.core import TaskRecord, DeadLetterRecord, EXECUTION_TERMINAL_STATES
 
 # ANSI color codes (fallback when rich is not available)
 class Colors:
@@ -117,6 +117,13 @@ def truncate(s: str, length: int) -> str:
     return s[:length - 3] + "..."
 
 
+# Row layouts for the list commands; rows are %-formatted and written in one call.
+# State columns are wider than their headers to absorb ANSI color codes.
+_EXECUTION_ROW_FMT = "%-36s %-22s %-10s %-20s %-10s"
+_TASK_ROW_FMT = "%-36s %-20s %-12s %-25s %-10s"
+_DLQ_ROW_FMT = "%-36s %-25s %-20s %-30s"
+
+
 # ============================================================================
 # EXECUTION COMMANDS
 # ============================================================================
@@ -124,7 +131,7 @@ def truncate(s: str, length: int) -> str:
 async def list_executions(executor: Stent, args):
     """List executions with filtering."""
     state_filter = args.state.lower() if args.state else None
-    executions = await executor.list_executions(limit=args.limit, state=state_filter)
+    executions = await executor.list_execution_summaries(limit=args.limit, state=state_filter)
     
     if not executions:
         print(f"{Colors.DIM}No executions found.{Colors.RESET}")
@@ -134,17 +141,25 @@ async def list_executions(executor: Stent, args):
     print(f"{Colors.BOLD}{'ID':<36} {'State':<12} {'Queue':<10} {'Started':<20} {'Duration':<10}{Colors.RESET}")
     print("-" * 90)
     
+    # Build every row first and emit them with a single write; large --limit
+    # audits otherwise pay for one print()/flush per execution.
+    now = datetime.now()
+    rows = []
     for exc in executions:
         duration = None
         if exc.started_at:
-            end_time = exc.completed_at or datetime.now()
-            duration = end_time - exc.started_at
+            duration = (exc.completed_at or now) - exc.started_at
         
-        queue = exc.queue or "default"
-        started = format_time(exc.started_at)
-        dur_str = format_duration(duration)
-        
-        print(f"{exc.id:<36} {state_color(exc.state):<22} {queue:<10} {started:<20} {dur_str:<10}")
+        rows.append(_EXECUTION_ROW_FMT % (
+            exc.id,
+            state_color(exc.state),
+            exc.queue or "default",
+            format_time(exc.started_at),
+            format_duration(duration),
+        ))
+
+    sys.stdout.write("\n".join(rows))
+    sys.stdout.write("\n")
 
 
 async def show_execution(executor: Stent, args):
@@ -247,10 +262,18 @@ async def list_tasks(executor: Stent, args):
     print(f"{Colors.BOLD}{'Task ID':<36} {'State':<10} {'Kind':<12} {'Step':<25} {'Queue':<10}{Colors.RESET}")
     print("-" * 100)
     
-    for task in tasks:
-        step = truncate(task.step_name, 25)
-        queue = task.queue or "default"
-        print(f"{task.id:<36} {state_color(task.state):<20} {task.kind:<12} {step:<25} {queue:<10}")
+    rows = [
+        _TASK_ROW_FMT % (
+            task.id,
+            state_color(task.state),
+            task.kind,
+            truncate(task.step_name, 25),
+            task.queue or "default",
+        )
+        for task in tasks
+    ]
+    sys.stdout.write("\n".join(rows))
+    sys.stdout.write("\n")
 
 
 async def show_task(executor: Stent, args):
@@ -383,12 +406,17 @@ async def dlq_list(executor: Stent, args):
     print(f"{Colors.BOLD}{'Task ID':<36} {'Step':<25} {'Moved At':<20} {'Reason':<30}{Colors.RESET}")
     print("-" * 115)
     
-    for record in records:
-        task = record.task
-        step = truncate(task.step_name, 25)
-        moved = format_time(record.moved_at)
-        reason = truncate(record.reason or "", 30)
-        print(f"{task.id:<36} {step:<25} {moved:<20} {reason:<30}")
+    rows = [
+        _DLQ_ROW_FMT % (
+            record.task.id,
+            truncate(record.task.step_name, 25),
+            format_time(record.moved_at),
+            truncate(record.reason or "", 30),
+        )
+        for record in records
+    ]
+    sys.stdout.write("\n".join(rows))
+    sys.stdout.write("\n")
 
 
 async def dlq_show(executor: Stent, args):
@@ -707,7 +735,7 @@ async def _gather_dashboard_data(executor: Stent, *, active_limit: int = 10, rec
     # Recent completions (terminal states only)
     recent_completions: list[RecentCompletion] = []
     for exc in recent_execs_raw:
-        if exc.state not in ("completed", "failed", "timed_out", "cancelled"):
+        if exc.state not in EXECUTION_TERMINAL_STATES:
             continue
         dur = None
         if exc.started_at:
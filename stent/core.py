@@ -8,7 +8,19 @@ T = TypeVar("T")
 E = TypeVar("E")
 U = TypeVar("U")
 
-@dataclass
+# Terminal states as frozensets for constant-time membership checks in polling loops.
+TASK_TERMINAL_STATES: frozenset[str] = frozenset({"completed", "failed"})
+EXECUTION_TERMINAL_STATES: frozenset[str] = frozenset({"completed", "failed", "timed_out", "cancelled"})
+
+def _setstate_from_pickle(obj: Any, state: Any) -> None:
+    # Slotted pickles carry (None, slots); pickles written before slots=True carry the old __dict__.
+    if isinstance(state, tuple):
+        dict_state, slot_state = state
+        state = {**(dict_state or {}), **(slot_state or {})}
+    for key, value in state.items():
+        object.__setattr__(obj, key, value)
+
+@dataclass(slots=True)
 class Result(Generic[T, E]):
     ok: bool
     value: T | None
@@ -55,7 +67,10 @@ class Result(Generic[T, E]):
     def __bool__(self) -> bool:
         return self.ok
 
-@dataclass
+    def __setstate__(self, state: Any) -> None:
+        _setstate_from_pickle(self, state)
+
+@dataclass(slots=True)
 class RetryPolicy:
     max_attempts: int = 3
     backoff_factor: float = 2.0
@@ -64,6 +79,9 @@ class RetryPolicy:
     jitter: float = 0.1
     retry_for: tuple[type[BaseException], ...] = (Exception,)
 
+    def __setstate__(self, state: Any) -> None:
+        _setstate_from_pickle(self, state)
+
 def compute_retry_delay(policy: RetryPolicy, attempt: int, *, rng: random.Random = random.Random()) -> float:
     # attempt is 1-based (1 = first retry)
     # wait = initial * (factor ^ (attempt - 1))
@@ -80,7 +98,7 @@ def compute_retry_delay(policy: RetryPolicy, attempt: int, *, rng: random.Random
     
     return max(0.0, delay)
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionProgress:
     step: str
     status: Literal["dispatched", "running", "completed", "failed", "cache_hit"]
@@ -88,7 +106,7 @@ class ExecutionProgress:
     completed_at: datetime | None = None
     detail: str | None = None
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionRecord:
     id: str
     root_function: str
@@ -107,7 +125,7 @@ class ExecutionRecord:
     result: bytes | None = None
     error: bytes | None = None
 
-@dataclass
+@dataclass(slots=True)
 class TaskRecord:
     id: str
     execution_id: str
@@ -132,7 +150,7 @@ class TaskRecord:
     idempotency_key: str | None = None
     scheduled_for: datetime | None = None
 
-@dataclass
+@dataclass(slots=True)
 class SignalRecord:
     execution_id: str
     name: str
@@ -141,7 +159,7 @@ class SignalRecord:
     consumed: bool = False
     consumed_at: datetime | None = None
 
-@dataclass
+@dataclass(slots=True)
 class DeadLetterRecord:
     task: TaskRecord
     reason: str
@@ -155,7 +173,16 @@ class DeadLetterRecord:
     def execution_id(self) -> str:
         return self.task.execution_id
 
-@dataclass
+@dataclass(slots=True)
+class ExecutionSummary:
+    """Column-projected execution row for listings that skip payloads and progress."""
+    id: str
+    state: str
+    queue: str | None
+    started_at: datetime | None
+    completed_at: datetime | None
+
+@dataclass(slots=True)
 class ExecutionState:
     id: str
     state: str
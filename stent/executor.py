@@ -10,7 +10,7 @@ from contextvars import ContextVar
 
 from stent.core import (
     Result, RetryPolicy, TaskRecord, ExecutionProgress, 
-    ExecutionState, DeadLetterRecord
+    ExecutionState, ExecutionSummary, DeadLetterRecord, EXECUTION_TERMINAL_STATES
 )
 from stent.backend.base import Backend
 from stent.notifications.base import NotificationBackend
@@ -337,9 +337,24 @@ class Stent:
         self.background_tasks: set[asyncio.Task[Any]] = set()
         self._active_worker_lifecycles: set[WorkerLifecycle] = set()
         self._default_worker_lifecycle: WorkerLifecycle | None = None
+        # One event per running serve() loop; set when this process enqueues work
+        # so idle workers claim it immediately instead of waiting out the poll delay.
+        self._worker_wakeups: set[asyncio.Event] = set()
+        # Local wait_for() callers keyed by execution id; resolved by workers in this
+        # process as soon as the terminal state is persisted.
+        self._execution_waiters: dict[str, list[asyncio.Future[str]]] = {}
         
         self._register_builtin_tasks()
 
+    def _wake_workers(self) -> None:
+        for wakeup in self._worker_wakeups:
+            wakeup.set()
+
+    def _resolve_execution_waiters(self, execution_id: str, state: str) -> None:
+        for waiter in self._execution_waiters.pop(execution_id, []):
+            if not waiter.done():
+                waiter.set_result(state)
+
     def _register_builtin_tasks(self):
         if self.registry.get("stent.sleep"):
             return
@@ -867,7 +882,7 @@ class Stent:
         record = await self.backend.get_execution(execution_id)
         if not record:
             raise ValueError("Execution not found")
-        if record.state not in ("completed", "failed", "timed_out", "cancelled"):
+        if record.state not in EXECUTION_TERMINAL_STATES:
              raise Exception("Execution still running")
         
         if record.result:
@@ -892,22 +907,34 @@ class Stent:
         Blocks until the execution with the given ID is completed, failed, or timed out.
         Returns the result of the execution.
         """
-        # Quick check first
+        # Register before the first check so a completion in between isn't missed
+        waiter: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        self._execution_waiters.setdefault(execution_id, []).append(waiter)
         try:
-            return await self.result_of(execution_id)
-        except Exception:
-            pass # Not done yet
-
-        await wait_for_execution_terminal(
-            execution_id=execution_id,
-            state_of=self.state_of,
-            notification_backend=self.notification_backend,
-            expiry=expiry,
-            sleep_interval=0.5,
-            expiry_error_factory=ExpiryError,
-        )
+            # Quick check first
+            try:
+                return await self.result_of(execution_id)
+            except Exception:
+                pass # Not done yet
+
+            await wait_for_execution_terminal(
+                execution_id=execution_id,
+                state_of=self.state_of,
+                notification_backend=self.notification_backend,
+                expiry=expiry,
+                sleep_interval=0.5,
+                expiry_error_factory=ExpiryError,
+                local_waiter=waiter,
+            )
 
-        return await self.result_of(execution_id)
+            return await self.result_of(execution_id)
+        finally:
+            waiters = self._execution_waiters.get(execution_id)
+            if waiters is not None:
+                if waiter in waiters:
+                    waiters.remove(waiter)
+                if not waiters:
+                    del self._execution_waiters[execution_id]
 
     async def cancel(self, execution_id: str) -> None:
         """Request cancellation of a running or pending execution.
@@ -918,7 +945,7 @@ class Stent:
         record = await self.backend.get_execution(execution_id)
         if not record:
             raise ValueError(f"Execution {execution_id} not found")
-        if record.state in ("completed", "failed", "cancelled"):
+        if record.state in EXECUTION_TERMINAL_STATES:
             return  # Already terminal
 
         record.state = "cancelled"
@@ -936,6 +963,7 @@ class Stent:
 
         if self.notification_backend:
             await self.notification_backend.notify_execution_updated(execution_id, "cancelled")
+        self._resolve_execution_waiters(execution_id, "cancelled")
 
     async def list_executions(self, limit: int = 10, offset: int = 0, state: str | None = None) -> List[ExecutionState]:
         """
@@ -958,6 +986,13 @@ class Stent:
             ) for r in records
         ]
 
+    async def list_execution_summaries(self, limit: int = 10, offset: int = 0, state: str | None = None) -> List[ExecutionSummary]:
+        """
+        List executions projected to id/state/queue/timestamps only.
+        Avoids loading args, results and errors, which dominate row size for listings.
+        """
+        return await self.backend.list_execution_summaries(limit, offset, state)
+
     async def queue_depth(self, queue: str | None = None) -> int:
         """
         Returns the number of pending tasks in the specified queue (or all queues if None).
@@ -1014,6 +1049,7 @@ class Stent:
 
         await self.backend.create_task(new_task)
         await self.backend.delete_dead_task(original_id)
+        self._wake_workers()
 
         if record.task.kind == "orchestrator":
             execution = await self.backend.get_execution(new_task.execution_id)
@@ -1072,6 +1108,8 @@ class Stent:
         current_poll_delay = worker_poll_min
 
         sem = asyncio.Semaphore(max_concurrency)
+        wakeup = asyncio.Event()
+        self._worker_wakeups.add(wakeup)
         logger.info(f"Worker {worker_id} started. Queues: {queues}")
         lifecycle_handle.mark_ready()
         
@@ -1104,6 +1142,8 @@ class Stent:
                     if meta.max_concurrent is not None:
                         concurrency_limits[name] = meta.max_concurrent
 
+                # Clear before claiming so work enqueued mid-claim still wakes us
+                wakeup.clear()
                 try:
                     task = await self.backend.claim_next_task(
                         worker_id=worker_id,
@@ -1128,7 +1168,7 @@ class Stent:
                         current_poll_delay = worker_poll_min
                     else:
                         sem.release()
-                        await _original_sleep(current_poll_delay)
+                        await self._idle_until_wakeup(wakeup, current_poll_delay)
                         current_poll_delay = min(
                             worker_poll_max, current_poll_delay * worker_poll_backoff
                         )
@@ -1149,9 +1189,17 @@ class Stent:
                     await cleanup_task
                 except asyncio.CancelledError:
                     pass
+            self._worker_wakeups.discard(wakeup)
             lifecycle_handle.mark_stopped()
             self._active_worker_lifecycles.discard(lifecycle_handle)
 
+    async def _idle_until_wakeup(self, wakeup: asyncio.Event, timeout: float) -> None:
+        """Sleep up to *timeout* seconds, returning early if local work is enqueued."""
+        try:
+            await asyncio.wait_for(wakeup.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
     async def shutdown(self):
         """
         Gracefully shuts down the executor, waiting for pending background tasks.
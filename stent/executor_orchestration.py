@@ -77,6 +77,7 @@ async def execute_map_batch(
 
     if tasks_to_create:
         await executor.backend.create_tasks(tasks_to_create)
+        executor._wake_workers()
         if exec_id:
             for _ in tasks_to_create:
                 await executor.backend.append_progress(exec_id, ExecutionProgress(step=meta.name, status="dispatched"))
@@ -197,6 +198,8 @@ async def persist_dispatch_records(
     else:
         await executor.backend.create_execution(execution)
         await executor.backend.create_task(root_task)
+    if root_task.scheduled_for is None:
+        executor._wake_workers()
 
 
 async def schedule_activity_and_wait(
@@ -233,6 +236,8 @@ async def schedule_activity_and_wait(
     )
 
     await executor.backend.create_task(task)
+    if scheduled_for is None:
+        executor._wake_workers()
     await executor.backend.append_progress(
         exec_id,
         ExecutionProgress(step=meta.name, status="dispatched", detail=f"Scheduled for {delay}" if delay else None),
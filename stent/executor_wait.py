@@ -1,15 +1,12 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime
+import time
 from typing import Awaitable, Callable
 
-from stent.core import ExecutionState, TaskRecord
+from stent.core import EXECUTION_TERMINAL_STATES, TASK_TERMINAL_STATES, ExecutionState, TaskRecord
 from stent.notifications.base import NotificationBackend
 
-TASK_TERMINAL_STATES = ("completed", "failed")
-EXECUTION_TERMINAL_STATES = ("completed", "failed", "timed_out", "cancelled")
-
 
 async def wait_for_task_terminal(
     *,
@@ -36,13 +33,13 @@ async def wait_for_task_terminal(
             expiry_error_factory=expiry_error_factory,
         )
 
-    start = datetime.now()
+    start = time.monotonic()
     delay = poll_min_interval
     while True:
         task = await get_task(task_id)
         if task and task.state in TASK_TERMINAL_STATES:
             return task
-        if expiry and (datetime.now() - start).total_seconds() > expiry:
+        if expiry and time.monotonic() - start > expiry:
             raise expiry_error_factory(f"Task {task_id} timed out")
         await sleep_fn(delay)
         delay = min(poll_max_interval, delay * poll_backoff_factor)
@@ -60,7 +57,7 @@ async def _wait_task_with_notifications(
     sleep_fn: Callable[[float], Awaitable[None]],
     expiry_error_factory: Callable[[str], Exception],
 ) -> TaskRecord:
-    start = datetime.now()
+    start = time.monotonic()
     delay = poll_min_interval
 
     # Start listening before the first DB check to avoid a race where the task
@@ -93,7 +90,7 @@ async def _wait_task_with_notifications(
             if task and task.state in TASK_TERMINAL_STATES:
                 return task
 
-            if expiry and (datetime.now() - start).total_seconds() > expiry:
+            if expiry and time.monotonic() - start > expiry:
                 raise expiry_error_factory(f"Task {task_id} timed out")
 
             if notification_done:
@@ -131,6 +128,7 @@ async def wait_for_execution_terminal(
     expiry: float | None,
     sleep_interval: float,
     expiry_error_factory: Callable[[str], Exception],
+    local_waiter: asyncio.Future[str] | None = None,
 ) -> ExecutionState:
     if notification_backend:
         return await _wait_execution_with_notifications(
@@ -142,16 +140,20 @@ async def wait_for_execution_terminal(
             expiry_error_factory=expiry_error_factory,
         )
 
-    start = datetime.now()
+    start = time.monotonic()
     while True:
         state = await state_of(execution_id)
         if state.state in EXECUTION_TERMINAL_STATES:
             return state
 
-        if expiry and (datetime.now() - start).total_seconds() > expiry:
+        if expiry and time.monotonic() - start > expiry:
             raise expiry_error_factory(f"Timed out waiting for execution {execution_id}")
 
-        await asyncio.sleep(sleep_interval)
+        if local_waiter is not None:
+            # Resolved by an in-process worker; the timeout covers remote workers
+            await asyncio.wait((local_waiter,), timeout=sleep_interval)
+        else:
+            await asyncio.sleep(sleep_interval)
 
 
 async def _wait_execution_with_notifications(
@@ -163,7 +165,7 @@ async def _wait_execution_with_notifications(
     sleep_interval: float,
     expiry_error_factory: Callable[[str], Exception],
 ) -> ExecutionState:
-    start = datetime.now()
+    start = time.monotonic()
 
     notification_iter = notification_backend.subscribe_to_execution(execution_id, expiry=expiry)
 
@@ -191,7 +193,7 @@ async def _wait_execution_with_notifications(
             if state.state in EXECUTION_TERMINAL_STATES:
                 return state
 
-            if expiry and (datetime.now() - start).total_seconds() > expiry:
+            if expiry and time.monotonic() - start > expiry:
                 raise expiry_error_factory(f"Timed out waiting for execution {execution_id}")
 
             if notification_done:
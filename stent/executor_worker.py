@@ -82,6 +82,7 @@ async def run_claimed_task(
             if executor.notification_backend:
                 await executor.notification_backend.notify_task_updated(task.id, "failed")
                 await executor.notification_backend.notify_execution_updated(task.execution_id, "timed_out")
+            executor._resolve_execution_waiters(task.execution_id, "timed_out")
             await executor.backend.append_progress(
                 task.execution_id,
                 ExecutionProgress(step=task.step_name, status="failed", detail="Execution timed out"),
@@ -152,6 +153,7 @@ async def run_claimed_task(
                 if executor.notification_backend:
                     await executor.notification_backend.notify_task_updated(task.id, "failed")
                     await executor.notification_backend.notify_execution_updated(task.execution_id, "timed_out")
+                executor._resolve_execution_waiters(task.execution_id, "timed_out")
                 await executor.backend.append_progress(
                     task.execution_id,
                     ExecutionProgress(step=task.step_name, status="failed", detail="Execution timed out"),
@@ -182,6 +184,7 @@ async def run_claimed_task(
             await executor.backend.update_execution(execution)
             if executor.notification_backend:
                 await executor.notification_backend.notify_execution_updated(task.execution_id, "completed")
+            executor._resolve_execution_waiters(task.execution_id, "completed")
 
         if executor.notification_backend:
             await executor.notification_backend.notify_task_completed(task.id)
@@ -261,6 +264,7 @@ async def run_claimed_task(
                 await executor.backend.update_execution(execution_for_update)
                 if executor.notification_backend:
                     await executor.notification_backend.notify_execution_updated(task.execution_id, "failed")
+                executor._resolve_execution_waiters(task.execution_id, "failed")
 
             if executor.notification_backend:
                 await executor.notification_backend.notify_task_updated(task.id, "failed")
@@ -2,6 +2,7 @@ import redis.asyncio as redis
 import json
 import asyncio
 from typing import AsyncIterator, Dict, Any, Optional
+from stent.core import EXECUTION_TERMINAL_STATES, TASK_TERMINAL_STATES
 from stent.notifications.base import NotificationBackend
 
 class RedisBackend(NotificationBackend):
@@ -36,7 +37,7 @@ class RedisBackend(NotificationBackend):
                     if message["type"] == "message":
                         data = json.loads(message["data"])
                         yield data
-                        if data.get("state") in ("completed", "failed"):
+                        if data.get("state") in TASK_TERMINAL_STATES:
                             break
 
             if expiry:
@@ -75,7 +76,7 @@ class RedisBackend(NotificationBackend):
                     if message["type"] == "message":
                         data = json.loads(message["data"])
                         yield data
-                        if data.get("state") in ("completed", "failed", "timed_out", "cancelled"):
+                        if data.get("state") in EXECUTION_TERMINAL_STATES:
                             break
 
             if expiry:
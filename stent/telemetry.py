@@ -2,25 +2,26 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Callable, TypeVar, cast
 import functools
 import logging
-from stent import Stent
+import random
+import threading
 
 logger = logging.getLogger(__name__)
 
-_HAS_OTEL = False
+# Set once Stent's methods have been wrapped; makes instrument() idempotent.
+_INSTRUMENTED = False
+# Serializes the check-and-patch so concurrent instrument() calls cannot stack wrappers.
+_INSTRUMENT_LOCK = threading.Lock()
 
-# Try to import opentelemetry at runtime
-try:
-    from opentelemetry import trace as _trace  # type: ignore[import-not-found]
-    from opentelemetry.trace import Status as _Status, StatusCode as _StatusCode  # type: ignore[import-not-found]
-    _HAS_OTEL = True
-except ImportError:
-    # Provide stub values for when otel is not installed
-    _trace = None
-    _Status = None
-    _StatusCode = None
+# Dispatch sampling probe; seeded once at import.
+_rng = random.Random()
 
-# Type hints for when type checking (opentelemetry may not be installed at runtime)
+# Step names come from the function registry, so this stays small.
+_step_span_names: dict[str, str] = {}
+
+# Stent and opentelemetry are imported inside instrument(), so importing this
+# module stays cheap and does not pull in the executor or the OTel SDK.
 if TYPE_CHECKING:
+    from stent import Stent
     from opentelemetry import trace  # type: ignore[import-not-found]
     from opentelemetry.trace import Status, StatusCode, Tracer  # type: ignore[import-not-found]
     # Create type aliases that are only used during type checking
@@ -31,51 +32,103 @@ if TYPE_CHECKING:
 F = TypeVar('F', bound=Callable[..., Any])
 
 
-def instrument(tracer_provider: Any = None) -> bool:
+def _is_noop_provider(trace_mod: Any, tracer_provider: Any) -> bool:
+    """
+    True when spans would never be recorded: an explicit NoOpTracerProvider,
+    or no provider passed and no global provider configured yet.
+    """
+    provider = tracer_provider if tracer_provider is not None else trace_mod.get_tracer_provider()
+    return isinstance(provider, (trace_mod.NoOpTracerProvider, trace_mod.ProxyTracerProvider))
+
+
+def instrument(tracer_provider: Any = None, *, force: bool = False, sample_ratio: float = 1.0) -> bool:
     """
     Instruments the Stent library with OpenTelemetry.
     Returns True if instrumentation was installed, False otherwise.
+
+    When no real tracer provider is configured the wrappers would only add
+    per-call overhead, so instrumentation is skipped unless ``force=True``.
+    Configure the provider (e.g. ``trace.set_tracer_provider``) before calling.
+
+    ``sample_ratio`` is the fraction of ``dispatch`` calls that get a span;
+    the rest call straight through. Task execution spans are always created.
     """
-    if not _HAS_OTEL or _trace is None:
+    if not 0.0 <= sample_ratio <= 1.0:
+        raise ValueError(f"sample_ratio must be between 0.0 and 1.0, got {sample_ratio}")
+
+    if _INSTRUMENTED:
+        return True
+
+    try:
+        from opentelemetry import trace as trace_mod  # type: ignore[import-not-found]
+    except ImportError:
         logger.warning("OpenTelemetry not installed; skipping Stent instrumentation.")
         return False
 
-    tracer = _trace.get_tracer("stent", tracer_provider=tracer_provider)
+    if not force and _is_noop_provider(trace_mod, tracer_provider):
+        logger.warning(
+            "No OpenTelemetry tracer provider configured; skipping Stent instrumentation. "
+            "Set a provider first or pass force=True."
+        )
+        return False
+
+    tracer = trace_mod.get_tracer("stent", tracer_provider=tracer_provider)
     
-    _instrument_executor(tracer)
+    _instrument_executor(tracer, sample_ratio=sample_ratio)
     return True
 
 
-def _instrument_executor(tracer: Any) -> None:
+def _instrument_executor(tracer: Any, *, sample_ratio: float = 1.0) -> None:
     """
     Internal function to instrument the executor methods.
     
-    Note: This function is only called when _HAS_OTEL is True,
-    so _trace, _Status, and _StatusCode are guaranteed to be non-None.
+    Note: This function is only called by instrument() after opentelemetry
+    has been imported successfully.
     """
-    # Idempotency check
-    if getattr(Stent.dispatch, "_is_otel_instrumented", False):
-        return
+    global _INSTRUMENTED
+    with _INSTRUMENT_LOCK:
+        if _INSTRUMENTED:
+            return
+        _patch_executor(tracer, sample_ratio=sample_ratio)
+        _INSTRUMENTED = True
+
 
-    # Local references to ensure type checker knows these are non-None
-    # (they are guaranteed to be set because instrument() guards this call)
-    trace_mod = cast(Any, _trace)
-    status_cls = cast(Any, _Status)
-    status_code_cls = cast(Any, _StatusCode)
+def _patch_executor(tracer: Any, *, sample_ratio: float) -> None:
+    """Wrap ``Stent.dispatch`` and ``Stent._handle_task``; callers hold ``_INSTRUMENT_LOCK``."""
+    from opentelemetry import trace as trace_mod  # type: ignore[import-not-found]
+    from opentelemetry.trace import Status, StatusCode  # type: ignore[import-not-found]
+    from stent import Stent
+
+    status_cls = cast(Any, Status)
+    status_code_cls = cast(Any, StatusCode)
 
     original_dispatch = Stent.dispatch
     original_handle_task = Stent._handle_task
     
     @functools.wraps(original_dispatch)
     async def dispatch_wrapper(self: Stent, fn: Any, *args: Any, **kwargs: Any) -> str:
-        # Resolve name properly if it's a wrapped function
-        name = "unknown"
-        if hasattr(fn, "__name__"):
-            name = fn.__name__
-        
-        with tracer.start_as_current_span(f"stent.dispatch {name}", kind=trace_mod.SpanKind.PRODUCER) as span:
-            span.set_attribute("stent.function", name)
-            
+        if sample_ratio < 1.0 and _rng.random() >= sample_ratio:
+            return await original_dispatch(self, fn, *args, **kwargs)
+
+        # Durable functions are long-lived, so memoize the span name on them
+        span_name = getattr(fn, "_stent_dispatch_span_name", None)
+        if span_name is None:
+            name = getattr(fn, "__name__", "unknown")
+            span_name = f"stent.dispatch {name}"
+            try:
+                fn._stent_dispatch_span_name = span_name
+                fn._stent_name = name
+            except AttributeError:
+                pass
+        else:
+            name = fn._stent_name
+
+        attributes = {"stent.function": name}
+        with tracer.start_as_current_span(
+            span_name,
+            kind=trace_mod.SpanKind.PRODUCER,
+            attributes=attributes,
+        ) as span:
             try:
                 exec_id = await original_dispatch(self, fn, *args, **kwargs)
                 span.set_attribute("stent.execution_id", exec_id)
@@ -91,12 +144,20 @@ def _instrument_executor(tracer: Any) -> None:
     @functools.wraps(original_handle_task)
     async def handle_task_wrapper(self: Stent, task: Any, worker_id: str, *args: Any, **kwargs: Any) -> None:
         # Consumer span
-        with tracer.start_as_current_span(f"stent.execute {task.step_name}", kind=trace_mod.SpanKind.CONSUMER) as span:
-             span.set_attribute("stent.task_id", task.id)
-             span.set_attribute("stent.execution_id", task.execution_id)
-             span.set_attribute("stent.step", task.step_name)
-             span.set_attribute("stent.worker_id", worker_id)
-             
+        attributes = {
+            "stent.task_id": task.id,
+            "stent.execution_id": task.execution_id,
+            "stent.step": task.step_name,
+            "stent.worker_id": worker_id,
+        }
+        span_name = _step_span_names.get(task.step_name)
+        if span_name is None:
+            span_name = _step_span_names[task.step_name] = f"stent.execute {task.step_name}"
+        with tracer.start_as_current_span(
+            span_name,
+            kind=trace_mod.SpanKind.CONSUMER,
+            attributes=attributes,
+        ) as span:
              try:
                  await original_handle_task(self, task, worker_id, *args, **kwargs)
                  
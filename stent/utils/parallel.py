@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, Iterable, TypeVar
+
+T = TypeVar("T")
+
+
+async def parallel_map(
+    fn: Callable[[T], Awaitable[Any]],
+    items: Iterable[T],
+    *,
+    concurrency: int = 16,
+    return_exceptions: bool = False,
+) -> list[Any]:
+    """Await ``fn(item)`` for every item with at most *concurrency* calls in flight.
+
+    Results are returned in input order. A lightweight wrapper task is created
+    for every item up front, but ``fn(item)`` is only called once one of the
+    *concurrency* slots is free, so at most that many calls (and durable child
+    dispatches) are in flight at a time.
+
+    By default the first failure is raised (unwrapped from the task group) and
+    the other in-flight and waiting calls are cancelled, unlike
+    ``asyncio.gather``, which leaves its siblings running. Cancellation only
+    stops the local awaits: durable child tasks that were already dispatched
+    keep running in the backend. With ``return_exceptions=True`` exceptions
+    are returned in place of results instead.
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _run(item: T) -> Any:
+        async with sem:
+            if not return_exceptions:
+                return await fn(item)
+            try:
+                return await fn(item)
+            except Exception as e:
+                return e
+
+    try:
+        async with asyncio.TaskGroup() as tg:
+            futures = [tg.create_task(_run(item)) for item in items]
+    except BaseExceptionGroup as eg:
+        # Raise the first failure itself rather than the ExceptionGroup
+        raise eg.exceptions[0] from None
+    return [f.result() for f in futures]
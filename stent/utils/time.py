@@ -1,6 +1,17 @@
 from datetime import datetime, timedelta, timezone
 import re
 
+# Composite duration tokens like "2d", "8h", "1.5m"; matched back-to-back.
+_DURATION_TOKEN_RE = re.compile(r"(\d+(?:\.\d*)?)([smhdw])")
+
+_UNIT_SECONDS = {
+    "s": 1.0,
+    "m": 60.0,
+    "h": 3600.0,
+    "d": 86400.0,
+    "w": 604800.0,
+}
+
 def parse_duration(duration: str | dict | timedelta) -> timedelta:
     if isinstance(duration, timedelta):
         return duration
@@ -15,27 +26,20 @@ def parse_duration(duration: str | dict | timedelta) -> timedelta:
     if not text:
         raise ValueError(f"Invalid duration string: {duration}")
 
+    # Fast path for the common single-unit integer form ("30s", "5m") without the regex engine
+    unit_seconds = _UNIT_SECONDS.get(text[-1])
+    if unit_seconds is not None and text[:-1].isdecimal():
+        return timedelta(seconds=int(text[:-1]) * unit_seconds)
+
     # Parse composite duration strings like "2d8h", "1h30m", "10s"
-    token_re = re.compile(r"(\d+(?:\.\d*)?)([smhdw])")
     total_seconds = 0.0
     pos = 0
-    for match in token_re.finditer(text):
+    for match in _DURATION_TOKEN_RE.finditer(text):
         if match.start() != pos:
             raise ValueError(f"Invalid duration string: {duration}")
 
         value_str, unit = match.groups()
-        value = float(value_str)
-        if unit == 's':
-            total_seconds += value
-        elif unit == 'm':
-            total_seconds += value * 60
-        elif unit == 'h':
-            total_seconds += value * 3600
-        elif unit == 'd':
-            total_seconds += value * 86400
-        elif unit == 'w':
-            total_seconds += value * 604800
-
+        total_seconds += float(value_str) * _UNIT_SECONDS[unit]
         pos = match.end()
 
     if pos == 0 or pos != len(text):
@@ -1,11 +1,13 @@
 import asyncio
+import json
 from datetime import datetime, timedelta
 from typing import List
 
 import pytest
 
+import stent.backend.utils as backend_utils
 from stent.backend.sqlite import SQLiteBackend
-from stent.core import ExecutionRecord, TaskRecord, RetryPolicy
+from stent.core import ExecutionProgress, ExecutionRecord, TaskRecord, RetryPolicy
 from tests.utils import cleanup_test_backend
 
 
@@ -212,3 +214,81 @@ async def test_sqlite_count_apis(tmp_path):
     assert await backend.count_dead_tasks() == 1
 
     await cleanup_test_backend(backend)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_concurrent_progress_appends_are_all_committed(tmp_path):
+    backend = SQLiteBackend(str(tmp_path / "progress.sqlite"))
+    await backend.init_db()
+    await backend.create_execution(_make_execution("exec-progress"))
+
+    await asyncio.gather(*(
+        backend.append_progress("exec-progress", ExecutionProgress(step=f"step-{i}", status="dispatched"))
+        for i in range(100)
+    ))
+
+    record = await backend.get_execution("exec-progress")
+    assert record is not None
+    assert [p.step for p in record.progress] == [f"step-{i}" for i in range(100)]
+    assert backend._pending_progress == []
+
+    await cleanup_test_backend(backend)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_progress_timestamps_stored_as_epoch_micros(tmp_path):
+    backend = SQLiteBackend(str(tmp_path / "progress_micros.sqlite"))
+    await backend.init_db()
+    await backend.create_execution(_make_execution("exec-micros"))
+
+    started = datetime(2024, 5, 1, 12, 30, 15, 123456)
+    await backend.append_progress(
+        "exec-micros",
+        ExecutionProgress(step="step", status="completed", started_at=started, completed_at=started + timedelta(seconds=2)),
+    )
+    pre_epoch = datetime(1965, 3, 2, 8, 0, 0, 1)
+    await backend.append_progress("exec-micros", ExecutionProgress(step="old", status="completed", started_at=pre_epoch))
+
+    db = await backend._get_connection()
+    async with db.execute("SELECT typeof(started_at) FROM execution_progress WHERE execution_id = ?", ("exec-micros",)) as cursor:
+        row = await cursor.fetchone()
+    assert row is not None and row[0] == "integer"
+
+    record = await backend.get_execution("exec-micros")
+    assert record is not None
+    assert record.progress[0].started_at == started
+    assert record.progress[0].completed_at == started + timedelta(seconds=2)
+    assert record.progress[1].started_at == pre_epoch
+
+    await cleanup_test_backend(backend)
+
+
+def _json_impls() -> list:
+    impls: list = [pytest.param(None, id="stdlib")]
+    try:
+        import orjson
+    except ImportError:
+        impls.append(pytest.param(None, id="orjson", marks=pytest.mark.skip(reason="orjson not installed")))
+    else:
+        impls.append(pytest.param(orjson, id="orjson"))
+    return impls
+
+
+@pytest.mark.parametrize("json_impl", _json_impls())
+def test_backend_json_round_trips_non_finite_retry_policy(monkeypatch, json_impl):
+    monkeypatch.setattr(backend_utils, "_orjson", json_impl)
+
+    policy = RetryPolicy(max_delay=float("inf"))
+    encoded = backend_utils.retry_policy_to_json(policy)
+    assert backend_utils.retry_policy_from_json(encoded).max_delay == float("inf")
+
+    assert backend_utils.loads_json(backend_utils.dumps_json(["a", "b"])) == ["a", "b"]
+    assert backend_utils.loads_json(backend_utils.dumps_json({"x": 2**70})) == {"x": 2**70}
+
+
+@pytest.mark.parametrize("json_impl", _json_impls())
+def test_backend_json_reads_rows_written_by_stdlib(monkeypatch, json_impl):
+    monkeypatch.setattr(backend_utils, "_orjson", json_impl)
+
+    legacy = json.dumps({"max_attempts": 2, "max_delay": float("inf")})
+    assert backend_utils.retry_policy_from_json(legacy).max_delay == float("inf")
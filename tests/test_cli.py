@@ -5,7 +5,7 @@ from typing import Any, cast
 import pytest
 
 import stent.cli as cli
-from stent.core import ExecutionState, Result
+from stent.core import ExecutionState, ExecutionSummary, Result, TaskRecord
 
 
 class _SpyBackend:
@@ -25,6 +25,11 @@ class _SpyBackend:
             raise RuntimeError("boom")
         return []
 
+    async def list_execution_summaries(self, limit: int = 10, offset: int = 0, state: str | None = None):
+        if self.raise_on_list:
+            raise RuntimeError("boom")
+        return []
+
 
 class _StatsBackend(_SpyBackend):
     def __init__(self):
@@ -56,6 +61,20 @@ class _StatsBackend(_SpyBackend):
         return None
 
 
+class _ListExecutor:
+    async def list_execution_summaries(self, limit: int = 10, offset: int = 0, state: str | None = None):
+        return [
+            ExecutionSummary(
+                id=f"exec-{i}",
+                state="completed",
+                queue="billing" if i else None,
+                started_at=datetime(2024, 1, 1, 12, 0, 0),
+                completed_at=datetime(2024, 1, 1, 12, 0, 5),
+            )
+            for i in range(3)
+        ]
+
+
 class _ShowExecutor:
     async def state_of(self, _execution_id: str) -> ExecutionState:
         return ExecutionState(
@@ -138,3 +157,63 @@ async def test_show_execution_prints_counters_and_custom_state(capsys):
     assert "Custom State" in out
     assert "owner: foo" in out
     assert "phase: bar_done" in out
+
+
+@pytest.mark.asyncio
+async def test_list_executions_renders_one_row_per_execution(capsys):
+    class _Args:
+        state = None
+        limit = 10
+
+    await cli.list_executions(cast(Any, _ListExecutor()), _Args())
+    lines = capsys.readouterr().out.splitlines()
+
+    rows = lines[2:]
+    assert len(rows) == 3
+    assert rows[0].startswith("exec-0")
+    assert "default" in rows[0]
+    assert "billing" in rows[1]
+    assert "2024-01-01 12:00:00" in rows[2]
+    assert "5s" in rows[2]
+
+
+@pytest.mark.asyncio
+async def test_list_tasks_renders_one_row_per_task(capsys):
+    class _TaskBackend:
+        async def list_tasks(self, limit: int = 10, offset: int = 0, state: str | None = None):
+            return [
+                TaskRecord(
+                    id=f"task-{i}",
+                    execution_id="exec-1",
+                    step_name="tests.step_with_a_rather_long_name",
+                    kind="activity",
+                    parent_task_id=None,
+                    state="pending",
+                    args=b"",
+                    kwargs=b"",
+                    retries=0,
+                    created_at=datetime(2024, 1, 1),
+                    tags=[],
+                    priority=0,
+                    queue="billing" if i else None,
+                    retry_policy=None,
+                )
+                for i in range(2)
+            ]
+
+    class _TaskExecutor:
+        backend = _TaskBackend()
+
+    class _Args:
+        state = None
+        limit = 10
+
+    await cli.list_tasks(cast(Any, _TaskExecutor()), _Args())
+    rows = capsys.readouterr().out.splitlines()[2:]
+
+    assert len(rows) == 2
+    assert rows[0].startswith("task-0")
+    assert "activity" in rows[0]
+    assert "default" in rows[0]
+    assert "tests.step_with_a_rath..." in rows[0]
+    assert "billing" in rows[1]
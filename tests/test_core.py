@@ -1,5 +1,6 @@
 import unittest
 import json
+import pickle
 from datetime import timedelta, timezone
 from stent.core import Result, RetryPolicy, compute_retry_delay
 from stent.utils.serialization import JsonSerializer
@@ -24,6 +25,32 @@ class TestCore(unittest.TestCase):
         self.assertFalse(decoded.ok)
         self.assertEqual(decoded.error, "Something bad")
         
+    def test_result_pickle_roundtrip_without_instance_dict(self):
+        r = Result.Ok([1, 2])
+        self.assertFalse(hasattr(r, "__dict__"))
+        decoded = pickle.loads(pickle.dumps(r))
+        self.assertEqual(decoded, r)
+
+    def test_unpickles_results_written_before_slots(self):
+        # Pickled with the pre-slots dataclasses; stored results must stay readable after upgrade
+        legacy_result = (
+            b"\x80\x04\x95A\x00\x00\x00\x00\x00\x00\x00\x8c\nstent.core\x94\x8c\x06Result\x94\x93\x94)\x81\x94}\x94"
+            b"(\x8c\x02ok\x94\x88\x8c\x05value\x94}\x94\x8c\x01x\x94K\x01s\x8c\x05error\x94Nub."
+        )
+        legacy_policy = (
+            b"\x80\x04\x95\xb8\x00\x00\x00\x00\x00\x00\x00\x8c\nstent.core\x94\x8c\x0bRetryPolicy\x94\x93\x94)\x81\x94}\x94"
+            b"(\x8c\x0cmax_attempts\x94K\x07\x8c\x0ebackoff_factor\x94G@\x00\x00\x00\x00\x00\x00\x00"
+            b"\x8c\rinitial_delay\x94G?\xf0\x00\x00\x00\x00\x00\x00\x8c\tmax_delay\x94G@N\x00\x00\x00\x00\x00\x00"
+            b"\x8c\x06jitter\x94G?\xb9\x99\x99\x99\x99\x99\x9a\x8c\tretry_for\x94\x8c\x08builtins\x94\x8c\tException\x94"
+            b"\x93\x94\x85\x94ub."
+        )
+
+        self.assertEqual(pickle.loads(legacy_result), Result.Ok({"x": 1}))
+        self.assertEqual(pickle.loads(legacy_policy), RetryPolicy(max_attempts=7))
+
+        policy = RetryPolicy(max_attempts=5, retry_for=(ValueError,))
+        self.assertEqual(pickle.loads(pickle.dumps(policy)), policy)
+
     def test_retry_policy_calculation(self):
         policy = RetryPolicy(
             initial_delay=1.0,
@@ -53,6 +80,8 @@ class TestCore(unittest.TestCase):
         self.assertEqual(parse_duration("1h"), timedelta(hours=1))
         self.assertEqual(parse_duration("1h30m"), timedelta(hours=1, minutes=30))
         self.assertEqual(parse_duration("2d8h"), timedelta(days=2, hours=8))
+        self.assertEqual(parse_duration("2w"), timedelta(weeks=2))
+        self.assertEqual(parse_duration("1.5m"), timedelta(seconds=90))
         self.assertEqual(parse_duration({"minutes": 5}), timedelta(minutes=5))
         self.assertEqual(parse_duration(timedelta(seconds=12)), timedelta(seconds=12))
 
@@ -63,6 +92,9 @@ class TestCore(unittest.TestCase):
             "10sfoo",
             "foo10s",
             "1h 30m",
+            "s",
+            "-5s",
+            "1e3s",
         ]
 
         for value in invalid_values:
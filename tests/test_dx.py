@@ -181,6 +181,32 @@ class TestCancel(unittest.IsolatedAsyncioTestCase):
             await self.executor.cancel("nonexistent-id")
 
 
+class TestCancelTerminal(unittest.IsolatedAsyncioTestCase):
+    """Cancel on terminal states, with no worker running so nothing races the writes."""
+
+    async def asyncSetUp(self):
+        self.backend = get_test_backend(f"cancel_terminal_{os.getpid()}_{id(self)}")
+        await self.backend.init_db()
+        await clear_test_backend(self.backend)
+        self.executor = Stent(backend=self.backend)
+
+    async def asyncTearDown(self):
+        await self.executor.shutdown()
+        Stent.reset()
+        await cleanup_test_backend(self.backend)
+
+    async def test_cancel_timed_out_is_noop(self):
+        exec_id = await self.executor.dispatch(bare_task, 1)
+        record = await self.backend.get_execution(exec_id)
+        assert record is not None
+        record.state = "timed_out"
+        await self.backend.update_execution(record)
+
+        await self.executor.cancel(exec_id)
+        state = await self.executor.state_of(exec_id)
+        self.assertEqual(state.state, "timed_out")
+
+
 class TestReadiness(unittest.IsolatedAsyncioTestCase):
     async def test_wait_until_ready(self):
         backend = get_test_backend(f"ready_{os.getpid()}")
@@ -183,12 +183,8 @@ class TestExecution(unittest.IsolatedAsyncioTestCase):
         exec_id = await self.executor.dispatch(failing_task)
         
         # Wait for completion
-        while True:
-            state = await self.executor.state_of(exec_id)
-            if state.state in ("completed", "failed", "timed_out"):
-                break
-            await asyncio.sleep(0.1)
-            
+        await self.executor.wait_for(exec_id, expiry=30.0)
+
         state = await self.executor.state_of(exec_id)
         self.assertEqual(state.state, "failed")
         self.assertIn("I failed", str(state.result) if state.result else str(state))
@@ -266,12 +262,9 @@ class TestExecution(unittest.IsolatedAsyncioTestCase):
         key = str(uuid.uuid4())
         exec_id = await self.executor.dispatch(flaky_once_task, key)
 
-        while True:
-            state = await self.executor.state_of(exec_id)
-            if state.state in ("failed", "completed"):
-                break
-            await asyncio.sleep(0.05)
+        await self.executor.wait_for(exec_id, expiry=30.0)
 
+        state = await self.executor.state_of(exec_id)
         self.assertEqual(state.state, "failed")
         letters = await self.executor.list_dead_letters()
         self.assertEqual(len(letters), 1)
@@ -546,12 +539,7 @@ class TestExecution(unittest.IsolatedAsyncioTestCase):
 
 
     async def _wait_for_result(self, exec_id):
-        while True:
-            state = await self.executor.state_of(exec_id)
-            if state.state in ("completed", "failed", "timed_out"):
-                break
-            await asyncio.sleep(0.1)
-        return await self.executor.result_of(exec_id)
+        return await self.executor.wait_for(exec_id, expiry=30.0)
 
 
 class TestAutoDispatch(unittest.IsolatedAsyncioTestCase):
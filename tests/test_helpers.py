@@ -91,6 +91,16 @@ class TestHelpers(unittest.IsolatedAsyncioTestCase):
         except asyncio.CancelledError:
             pass
 
+    async def test_list_execution_summaries(self):
+        exec_id = await self.executor.dispatch(noop_task)
+
+        summaries = await self.executor.list_execution_summaries(limit=10)
+        self.assertEqual([s.id for s in summaries], [exec_id])
+        self.assertEqual(summaries[0].state, "pending")
+        self.assertIsNone(summaries[0].completed_at)
+
+        self.assertEqual(await self.executor.list_execution_summaries(state="completed"), [])
+
     async def test_worker_lifecycle_drain_and_status(self):
         # Stop default worker to avoid interference
         self.worker_task.cancel()
@@ -109,3 +119,26 @@ class TestHelpers(unittest.IsolatedAsyncioTestCase):
         await worker
         stopped_status = self.executor.worker_status_overview()
         self.assertTrue(stopped_status["draining"] or not stopped_status["workers"])
+
+    async def test_dispatch_wakes_idle_worker(self):
+        # Replace the default worker with one that would otherwise sleep for 5s
+        self.worker_task.cancel()
+        try:
+            await self.worker_task
+        except asyncio.CancelledError:
+            pass
+
+        slow_poll_worker = asyncio.create_task(self.executor.serve(poll_interval=5.0))
+        try:
+            await self.executor.wait_until_ready()
+            await _original_sleep(0.2)  # let the worker find the queue empty and go idle
+
+            exec_id = await self.executor.dispatch(noop_task)
+            result = await self.executor.wait_for(exec_id, expiry=2.0)
+            self.assertTrue(result.ok)
+        finally:
+            slow_poll_worker.cancel()
+            try:
+                await slow_poll_worker
+            except asyncio.CancelledError:
+                pass
@@ -3,7 +3,7 @@ import asyncio
 import os
 import logging
 import time
-from stent import Stent, Result
+from stent import Stent, Result, parallel_map
 from tests.utils import get_test_backend, cleanup_test_backend, clear_test_backend
 
 logging.basicConfig(level=logging.INFO)
@@ -28,6 +28,11 @@ async def fan_out_fan_in_workflow(count: int, duration: float) -> float:
     results = await parallel_orchestrator(count, duration)
     return sum(results)
 
+@Stent.durable()
+async def bounded_fan_out_workflow(count: int, duration: float) -> float:
+    results = await parallel_map(parallel_worker, [duration] * count, concurrency=count)
+    return sum(results)
+
 class TestParallel(unittest.IsolatedAsyncioTestCase):
     async def asyncSetUp(self):
         self.backend = get_test_backend(f"parallel_{os.getpid()}")
@@ -56,15 +61,8 @@ class TestParallel(unittest.IsolatedAsyncioTestCase):
         
         start_time = time.time()
         exec_id = await self.executor.dispatch(fan_out_fan_in_workflow, count, sleep_time)
-        
-        while True:
-            state = await self.executor.state_of(exec_id)
-            if state.state in ("completed", "failed", "timed_out"):
-                break
-            await asyncio.sleep(0.1)
-            
+        result = await self.executor.wait_for(exec_id, expiry=30.0)
         duration = time.time() - start_time
-        result = await self.executor.result_of(exec_id)
         
         self.assertTrue(result.ok)
         self.assertEqual(result.value, count * sleep_time)
@@ -114,3 +112,60 @@ class TestParallel(unittest.IsolatedAsyncioTestCase):
             # Fallback to duration check if we can't check timestamps
             self.assertLess(duration, count * sleep_time * 2.0, "Execution took too long")
 
+    async def test_parallel_map_fan_out(self):
+        count = 4
+        sleep_time = 0.5
+
+        start_time = time.time()
+        exec_id = await self.executor.dispatch(bounded_fan_out_workflow, count, sleep_time)
+        result = await self.executor.wait_for(exec_id, expiry=10.0)
+        duration = time.time() - start_time
+
+        self.assertTrue(result.ok)
+        self.assertEqual(result.value, count * sleep_time)
+        self.assertLess(duration, count * sleep_time * 2.0, "Execution took too long")
+
+
+class TestParallelMap(unittest.IsolatedAsyncioTestCase):
+    async def test_preserves_order_and_bounds_concurrency(self):
+        in_flight = 0
+        peak = 0
+
+        async def work(x: int) -> int:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01 * (5 - x))
+            in_flight -= 1
+            return x * 10
+
+        results = await parallel_map(work, range(5), concurrency=2)
+        self.assertEqual(results, [0, 10, 20, 30, 40])
+        self.assertEqual(peak, 2)
+
+    async def test_raises_first_failure(self):
+        async def work(x: int) -> int:
+            if x == 2:
+                raise ValueError("boom")
+            return x
+
+        with self.assertRaises(ValueError):
+            await parallel_map(work, range(4), concurrency=4)
+
+    async def test_return_exceptions(self):
+        async def work(x: int) -> int:
+            if x == 1:
+                raise ValueError("boom")
+            return x
+
+        results = await parallel_map(work, range(3), return_exceptions=True)
+        self.assertEqual(results[0], 0)
+        self.assertIsInstance(results[1], ValueError)
+        self.assertEqual(results[2], 2)
+
+    async def test_rejects_invalid_concurrency(self):
+        async def work(x: int) -> int:
+            return x
+
+        with self.assertRaises(ValueError):
+            await parallel_map(work, [1], concurrency=0)
@@ -104,9 +104,4 @@ class TestScenarios(unittest.IsolatedAsyncioTestCase):
         self.assertTrue(any("send_email" in s for s in steps), f"send_email not found in steps: {steps}")
 
     async def _wait_for_result(self, exec_id):
-        while True:
-            state = await self.executor.state_of(exec_id)
-            if state.state in ("completed", "failed", "timed_out"):
-                break
-            await asyncio.sleep(0.1)
-        return await self.executor.result_of(exec_id)
\ No newline at end of file
+        return await self.executor.wait_for(exec_id, expiry=30.0)
\ No newline at end of file
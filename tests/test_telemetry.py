@@ -0,0 +1,135 @@
+import unittest
+import asyncio
+import os
+from stent import Stent
+from tests.utils import get_test_backend, cleanup_test_backend, clear_test_backend
+
+try:
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+    HAS_OTEL_SDK = True
+except ImportError:
+    HAS_OTEL_SDK = False
+
+
+@Stent.durable()
+async def traced_task(x: int):
+    return x * 2
+
+
+@unittest.skipUnless(HAS_OTEL_SDK, "opentelemetry-sdk not installed")
+class TestTelemetry(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        # instrument() patches Stent in place; restore it after each test
+        self._original_dispatch = Stent.dispatch
+        self._original_handle_task = Stent._handle_task
+
+        self.exporter = InMemorySpanExporter()
+        self.provider = TracerProvider()
+        self.provider.add_span_processor(SimpleSpanProcessor(self.exporter))
+
+        self.backend = get_test_backend(f"telemetry_{os.getpid()}")
+        await self.backend.init_db()
+        await clear_test_backend(self.backend)
+        self.executor = Stent(backend=self.backend)
+
+    async def asyncTearDown(self):
+        import stent.telemetry
+
+        Stent.dispatch = self._original_dispatch  # type: ignore[method-assign]
+        Stent._handle_task = self._original_handle_task  # type: ignore[method-assign]
+        stent.telemetry._INSTRUMENTED = False
+        await self.executor.shutdown()
+        await cleanup_test_backend(self.backend)
+
+    async def _run_once(self) -> str:
+        exec_id = await self.executor.dispatch(traced_task, 21)
+        worker = asyncio.create_task(self.executor.serve(poll_interval=0.05))
+        try:
+            result = await self.executor.wait_for(exec_id, expiry=10.0)
+            self.assertEqual(result.value, 42)
+        finally:
+            worker.cancel()
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+        return exec_id
+
+    async def test_dispatch_and_execute_spans(self):
+        from stent.telemetry import instrument
+
+        self.assertTrue(instrument(tracer_provider=self.provider))
+        exec_id = await self._run_once()
+
+        spans = {span.name: span for span in self.exporter.get_finished_spans()}
+        dispatch_span = spans["stent.dispatch traced_task"]
+        assert dispatch_span.attributes is not None
+        self.assertEqual(dispatch_span.attributes["stent.function"], "traced_task")
+        self.assertEqual(dispatch_span.attributes["stent.execution_id"], exec_id)
+        self.assertEqual(getattr(traced_task, "_stent_dispatch_span_name"), "stent.dispatch traced_task")
+
+        execute_span = next(s for name, s in spans.items() if name.startswith("stent.execute "))
+        assert execute_span.attributes is not None
+        self.assertEqual(execute_span.attributes["stent.execution_id"], exec_id)
+        self.assertIn("stent.task_id", execute_span.attributes)
+        self.assertIn("stent.worker_id", execute_span.attributes)
+
+    async def test_skips_without_configured_provider(self):
+        from opentelemetry import trace
+        from stent.telemetry import instrument
+
+        self.assertFalse(instrument(tracer_provider=trace.NoOpTracerProvider()))
+        self.assertIs(Stent.dispatch, self._original_dispatch)
+        self.assertIs(Stent._handle_task, self._original_handle_task)
+
+    async def test_force_instruments_noop_provider(self):
+        from opentelemetry import trace
+        from stent.telemetry import instrument
+
+        self.assertTrue(instrument(tracer_provider=trace.NoOpTracerProvider(), force=True))
+        self.assertIsNot(Stent.dispatch, self._original_dispatch)
+
+    async def test_dispatch_sampling(self):
+        from stent.telemetry import instrument
+
+        self.assertTrue(instrument(tracer_provider=self.provider, sample_ratio=0.0))
+        await self._run_once()
+
+        names = [span.name for span in self.exporter.get_finished_spans()]
+        self.assertFalse(any(name.startswith("stent.dispatch ") for name in names))
+        self.assertTrue(any(name.startswith("stent.execute ") for name in names))
+
+    def test_sample_ratio_validation(self):
+        from stent.telemetry import instrument
+
+        with self.assertRaises(ValueError):
+            instrument(tracer_provider=self.provider, sample_ratio=1.5)
+
+    async def test_instrument_is_idempotent(self):
+        from stent.telemetry import instrument
+
+        self.assertTrue(instrument(tracer_provider=self.provider))
+        wrapped_dispatch = Stent.dispatch
+        self.assertTrue(instrument(tracer_provider=self.provider))
+        self.assertIs(Stent.dispatch, wrapped_dispatch)
+
+    def test_concurrent_instrument_wraps_once(self):
+        import threading
+        from stent.telemetry import instrument
+
+        barrier = threading.Barrier(8)
+
+        def call() -> None:
+            barrier.wait()
+            instrument(tracer_provider=self.provider)
+
+        threads = [threading.Thread(target=call) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertIs(getattr(Stent.dispatch, "__wrapped__"), self._original_dispatch)
+        self.assertIs(getattr(Stent._handle_task, "__wrapped__"), self._original_handle_task)
@@ -47,6 +47,18 @@ class TestWaitFor(unittest.IsolatedAsyncioTestCase):
         self.assertTrue(result.ok)
         self.assertEqual(result.value, "quick")
 
+    async def test_wait_resolved_by_local_worker(self):
+        exec_id = await self.executor.dispatch(quick_task)
+
+        start = asyncio.get_running_loop().time()
+        result = await self.executor.wait_for(exec_id, expiry=10.0)
+        elapsed = asyncio.get_running_loop().time() - start
+
+        self.assertEqual(result.value, "quick")
+        # Well under the 0.5s fallback poll: the worker resolved the waiter directly
+        self.assertLess(elapsed, 0.45)
+        self.assertEqual(self.executor._execution_waiters, {})
+
     async def test_wait_for_timeout(self):
         # We need a longer task than the wait expiry
         @Stent.durable()